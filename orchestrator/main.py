@@ -7,13 +7,29 @@ This service provides:
 - REST API for job management
 - Integration with TypeScript Core SDK agents
 - Real-time status tracking
+
+Submitted workflows are queued in Redis and executed by queue workers: one
+runs inside the API process by default, and more can be started with
+``python worker.py`` to scale execution horizontally.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any, Literal
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, PlainSerializer, TypeAdapter
+from typing import List, Dict, Optional, Any, Iterable, Literal, NamedTuple, Tuple, Annotated
+from dataclasses import dataclass, field
 from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+import asyncio
+import httpx
+import functools
+import json
+import logging
+import time
 import uuid
 import os
 from dotenv import load_dotenv
@@ -21,11 +37,78 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger("orchestrator")
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+EMBEDDED_WORKER = os.getenv("ORCHESTRATOR_EMBEDDED_WORKER", "true").lower() == "true"
+WORKER_CONCURRENCY = int(os.getenv("ORCHESTRATOR_WORKER_CONCURRENCY", "8"))
+
+# Finished workflows never change, so API processes keep their payloads locally
+STATUS_CACHE_SIZE = int(os.getenv("STATUS_CACHE_SIZE", "1024"))
+
+# TypeScript agent bridge; tasks are simulated when this is not set
+AGENT_BRIDGE_URL = os.getenv("AGENT_BRIDGE_URL")
+
+# Simulated work per task without a bridge (0 = none, so benchmarks measure the scheduler)
+_MOCK_DELAY = float(os.getenv("MOCK_AGENT_DELAY_MS", "0")) / 1000
+
+# Upper bound on agent calls in flight per process, across all workflows
+AGENT_SEM = asyncio.Semaphore(int(os.getenv("AGENT_MAX_CONCURRENCY", "32")))
+
+def configure_loop() -> None:
+    """Tune the running event loop"""
+    # Python 3.12+: start tasks eagerly so coroutines that finish without
+    # suspending (satisfied deps, fast failures) never get scheduled as Tasks
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+async def open_clients() -> None:
+    """Create the shared clients used by API handlers and queue workers"""
+    app.state.redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+    app.state.update_workflow = app.state.redis.register_script(_UPDATE_WORKFLOW_LUA)
+
+    # One pooled HTTP/2 client for the process lifetime, so parallel agent
+    # calls share a few keep-alive connections instead of handshaking each time
+    app.state.http = httpx.AsyncClient(
+        base_url=AGENT_BRIDGE_URL,
+        timeout=60.0,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    ) if AGENT_BRIDGE_URL else None
+
+async def close_clients() -> None:
+    """Close the shared clients"""
+    await app.state.redis.aclose()
+
+    if app.state.http is not None:
+        await app.state.http.aclose()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the event loop and shared clients for the lifetime of the service"""
+    configure_loop()
+    await open_clients()
+
+    background = [asyncio.create_task(watch_events())]
+    if EMBEDDED_WORKER:
+        background.append(asyncio.create_task(consume_queue(WORKER_CONCURRENCY)))
+
+    yield
+
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+
+    await close_clients()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Orchestra - Orchestration Service",
     description="Multi-agent workflow orchestration powered by Swarms",
     version="0.1.0",
+    lifespan=lifespan,
+    # Render response bodies with orjson (C) instead of the stdlib json encoder
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -37,6 +120,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ==========================================
+# Timestamps
+# ==========================================
+#
+# Timestamps are kept as epoch floats (time.time()) everywhere and only
+# formatted as ISO-8601 strings when a model is serialized to JSON.
+
+@functools.lru_cache(maxsize=1)
+def _iso_for(sec: int) -> str:
+    return datetime.utcfromtimestamp(sec).isoformat()
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as a UTC ISO-8601 string, reusing the current second's prefix"""
+    if ts is None:
+        return None
+    sec = int(ts)
+    return f"{_iso_for(sec)}.{int((ts - sec) * 1_000_000):06d}"
+
+# Epoch float in Python, ISO-8601 string in JSON (and in the OpenAPI schema)
+Timestamp = Annotated[float, PlainSerializer(_iso, return_type=str, when_used="json")]
+OptionalTimestamp = Annotated[
+    Optional[float], PlainSerializer(_iso, return_type=Optional[str], when_used="json")
+]
+
 # ==========================================
 # Models / Schemas
 # ==========================================
@@ -61,8 +168,8 @@ class TaskStatus(BaseModel):
     agent_id: str
     agent_role: str
     status: Literal["pending", "running", "completed", "failed"]
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    started_at: OptionalTimestamp = None
+    completed_at: OptionalTimestamp = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
@@ -71,17 +178,356 @@ class WorkflowStatus(BaseModel):
     workflow_id: str
     workflow_type: str
     status: Literal["pending", "running", "completed", "failed", "partial"]
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at: Timestamp
+    started_at: OptionalTimestamp = None
+    completed_at: OptionalTimestamp = None
     tasks: List[TaskStatus]
     metadata: Dict[str, Any]
 
+# Built once at import; endpoints serialize through it directly and return a
+# raw Response, which FastAPI passes through without re-validating it against
+# the response model (that only documents the schema)
+_WF_TA = TypeAdapter(WorkflowStatus)
+
 # ==========================================
-# In-Memory Storage (replace with Redis/DB in production)
+# Scheduler State
 # ==========================================
+#
+# Workers track execution in slotted dataclasses instead of pydantic models:
+# no per-instance __dict__, descriptors or validators in the inner loop.
+# Pydantic models are only built at the API boundary.
+
+@dataclass(slots=True)
+class _TaskRT:
+    """Execution state of a single task"""
+    task_id: str
+    agent_id: str
+    agent_role: str
+    status: str = "pending"
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
 
-workflows_store: Dict[str, WorkflowStatus] = {}
+@dataclass(slots=True)
+class _WorkflowRT:
+    """Execution state of a workflow (only the fields that change while it runs)"""
+    workflow_id: str
+    run: str
+    created_at: float
+    status: str
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    tasks: List[_TaskRT] = field(default_factory=list)
+
+# ==========================================
+# Redis Storage
+# ==========================================
+#
+# Each workflow lives in a hash ``wf:{id}`` holding the workflow-level fields
+# plus one JSON blob per task (``task:{i}``), so a task transition rewrites a
+# single field. Timestamps are stored as raw epoch floats.
+#
+# Every submission also stores a random ``run`` token. Workers only write
+# while the hash still carries the token of the run they are executing, so a
+# run that was deleted (or replaced by a resubmission under the same ID)
+# cannot recreate its hash or index entries with updates still in flight.
+#
+# ``wf:index`` is a sorted set of workflow IDs scored by creation time for
+# newest-first listing, and ``wf:status:{status}`` holds the same for each
+# status so filtered listing never scans.
+#
+# Submitted workflows are pushed onto the ``orch:queue`` list. A worker claims
+# a job by moving it onto its own ``orch:processing:{worker}`` list and drops
+# it from there once the workflow finishes, while refreshing a heartbeat key
+# ``orch:worker:{worker}``; jobs left on the list of a worker whose heartbeat
+# expired are put back on the queue. Every persisted transition is announced on the ``orch:events`` channel as
+# ``{workflow_id}:{task_id|workflow}:{status}``.
+
+WORKFLOW_INDEX = "wf:index"
+TASK_QUEUE = "orch:queue"
+EVENTS_CHANNEL = "orch:events"
+
+# Identifies this process's queue worker; a new one per start
+WORKER_ID = uuid.uuid4().hex
+WORKER_HEARTBEAT_TTL = 30
+
+# Seconds before a workflow whose execution failed outright is run again
+JOB_RETRY_DELAY = 5
+
+WORKFLOW_STATUSES = ("pending", "running", "completed", "failed", "partial")
+TERMINAL_STATUSES = ("completed", "failed", "partial")
+
+def _workflow_key(workflow_id: str) -> str:
+    return f"wf:{workflow_id}"
+
+def _status_index(status: str) -> str:
+    return f"wf:status:{status}"
+
+def _task_field(task_idx: int) -> str:
+    return f"task:{task_idx}"
+
+def _processing_list(worker_id: str) -> str:
+    return f"orch:processing:{worker_id}"
+
+def _heartbeat_key(worker_id: str) -> str:
+    return f"orch:worker:{worker_id}"
+
+def _workflow_fields(workflow: WorkflowStatus) -> Dict[str, str]:
+    """Flatten the workflow-level fields (everything but tasks) into a hash mapping"""
+    data = workflow.model_dump(exclude={"tasks"})
+    data["metadata"] = json.dumps(data["metadata"])
+    return {key: value for key, value in data.items() if value is not None}
+
+def _task_blob(task: _TaskRT) -> str:
+    return json.dumps({name: getattr(task, name) for name in _TaskRT.__slots__})
+
+def _status_keys(status: str) -> List[str]:
+    """Index keys for moving a workflow into `status`: the target first, then the rest"""
+    return [_status_index(status)] + [_status_index(s) for s in WORKFLOW_STATUSES if s != status]
+
+def _workflow_from_hash(data: Dict[str, str]) -> Optional[WorkflowStatus]:
+    """Rebuild a WorkflowStatus from its hash, or None if the hash is missing/partial"""
+    if "task_count" not in data:
+        return None
+
+    return WorkflowStatus(
+        workflow_id=data["workflow_id"],
+        workflow_type=data["workflow_type"],
+        status=data["status"],
+        created_at=data["created_at"],
+        started_at=data.get("started_at"),
+        completed_at=data.get("completed_at"),
+        tasks=[
+            TaskStatus.model_validate_json(data[_task_field(i)])
+            for i in range(int(data["task_count"]))
+        ],
+        metadata=json.loads(data["metadata"]),
+    )
+
+async def create_workflow(workflow: WorkflowStatus, run: str) -> None:
+    """Store a new workflow run and add it to the index"""
+    mapping = _workflow_fields(workflow)
+    mapping["run"] = run
+    mapping["task_count"] = str(len(workflow.tasks))
+    for i, task in enumerate(workflow.tasks):
+        # Plain json.dumps (not model_dump_json) keeps timestamps as epoch floats
+        mapping[_task_field(i)] = json.dumps(task.model_dump())
+
+    async with app.state.redis.pipeline(transaction=True) as pipe:
+        # A resubmitted workflow ID starts from a clean hash, not merged into the old run
+        pipe.delete(_workflow_key(workflow.workflow_id))
+        pipe.hset(_workflow_key(workflow.workflow_id), mapping=mapping)
+        pipe.zadd(WORKFLOW_INDEX, {workflow.workflow_id: workflow.created_at})
+        _index_status(pipe, workflow)
+        pipe.publish(EVENTS_CHANNEL, f"{workflow.workflow_id}:workflow:{workflow.status}")
+        await pipe.execute()
+
+def _index_status(pipe: Any, workflow: WorkflowStatus) -> None:
+    """Queue commands moving a workflow into the index for its current status"""
+    for status in WORKFLOW_STATUSES:
+        if status != workflow.status:
+            pipe.zrem(_status_index(status), workflow.workflow_id)
+    pipe.zadd(_status_index(workflow.status), {workflow.workflow_id: workflow.created_at})
+
+async def load_workflow(workflow_id: str) -> Optional[WorkflowStatus]:
+    """Fetch a workflow from the store, or None if it does not exist"""
+    data = await app.state.redis.hgetall(_workflow_key(workflow_id))
+    return _workflow_from_hash(data)
+
+async def load_runtime(workflow_id: str, run: str) -> Optional[_WorkflowRT]:
+    """Fetch the execution state of a workflow run, or None if it is gone or was resubmitted"""
+    data = await app.state.redis.hgetall(_workflow_key(workflow_id))
+    if data.get("run") != run:
+        return None
+
+    started_at = data.get("started_at")
+    completed_at = data.get("completed_at")
+
+    return _WorkflowRT(
+        workflow_id=workflow_id,
+        run=run,
+        created_at=float(data["created_at"]),
+        status=data["status"],
+        started_at=float(started_at) if started_at is not None else None,
+        completed_at=float(completed_at) if completed_at is not None else None,
+        tasks=[
+            _TaskRT(**json.loads(data[_task_field(i)]))
+            for i in range(int(data["task_count"]))
+        ],
+    )
+
+# Applies one update to a workflow hash, but only while it still belongs to the
+# same run; moves the workflow between status indexes and publishes events.
+#   KEYS: workflow hash [, target status index, other status indexes...]
+#   ARGV: run, channel, workflow_id, created_at, 2n, n field/value pairs, messages...
+_UPDATE_WORKFLOW_LUA = """
+if redis.call('HGET', KEYS[1], 'run') ~= ARGV[1] then
+    return 0
+end
+local n = tonumber(ARGV[5])
+-- unpack() is bounded by the Lua stack (~8000 values), so write in chunks
+for i = 6, 5 + n, 1000 do
+    redis.call('HSET', KEYS[1], unpack(ARGV, i, math.min(i + 999, 5 + n)))
+end
+for i = 3, #KEYS do
+    redis.call('ZREM', KEYS[i], ARGV[3])
+end
+if #KEYS > 1 then
+    redis.call('ZADD', KEYS[2], ARGV[4], ARGV[3])
+end
+for i = 6 + n, #ARGV do
+    redis.call('PUBLISH', ARGV[2], ARGV[i])
+end
+return 1
+"""
+
+async def _update_workflow(
+    workflow: _WorkflowRT,
+    mapping: Dict[str, Any],
+    messages: List[str],
+    index_status: bool = False,
+) -> None:
+    """
+    Apply an update to the workflow's current run in one round-trip
+
+    Raises CancelledError if the run was deleted or replaced by a
+    resubmission, so a stale run stops at its next write instead of carrying
+    on with work nobody will see.
+    """
+    keys = [_workflow_key(workflow.workflow_id)]
+    if index_status:
+        keys += _status_keys(workflow.status)
+
+    fields = [item for pair in mapping.items() for item in pair]
+    args = [workflow.run, EVENTS_CHANNEL, workflow.workflow_id, workflow.created_at, len(fields)]
+
+    if not await app.state.update_workflow(keys=keys, args=args + fields + messages):
+        raise asyncio.CancelledError(f"Workflow {workflow.workflow_id} run {workflow.run} is gone")
+
+async def save_workflow(workflow: _WorkflowRT, task_indices: Iterable[int] = ()) -> None:
+    """
+    Persist the workflow's status and timestamps, plus any given tasks, and announce the change
+
+    Everything goes out in one script call, so a transition costs a single
+    round-trip. Nothing is written if the run was deleted or replaced (see
+    _update_workflow).
+    """
+    mapping: Dict[str, Any] = {"status": workflow.status}
+    if workflow.started_at is not None:
+        mapping["started_at"] = workflow.started_at
+    if workflow.completed_at is not None:
+        mapping["completed_at"] = workflow.completed_at
+
+    messages = [f"{workflow.workflow_id}:workflow:{workflow.status}"]
+
+    for task_idx in task_indices:
+        task = workflow.tasks[task_idx]
+        mapping[_task_field(task_idx)] = _task_blob(task)
+        messages.append(f"{workflow.workflow_id}:{task.task_id}:{task.status}")
+
+    await _update_workflow(workflow, mapping, messages, index_status=True)
+
+async def save_task(workflow: _WorkflowRT, task_idx: int) -> None:
+    """Persist the status of a single task and announce the change in one round-trip"""
+    task = workflow.tasks[task_idx]
+
+    await _update_workflow(
+        workflow,
+        {_task_field(task_idx): _task_blob(task)},
+        [f"{workflow.workflow_id}:{task.task_id}:{task.status}"],
+    )
+
+# ==========================================
+# Finished Workflow Cache
+# ==========================================
+#
+# Completed/failed/partial workflows are immutable until deleted, so their
+# serialized payloads are cached in-process and served without touching
+# Redis. Any event for a cached workflow (deletion, or a resubmission under
+# the same ID) evicts it, including events published by other processes
+# (see watch_events). While the event subscription is down evictions could be
+# missed, so the cache is neither read nor filled until it is back.
+#
+# Events are numbered as they are handled, and readers note the current
+# number before fetching a workflow: if an event for it arrived while the
+# fetch was in flight, the (possibly already deleted) result is not cached.
+
+_terminal_cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+_cache_live = False
+
+# Number of the latest event per workflow, for the most recent workflows only;
+# anything older is covered by the number of the last one forgotten
+_EVENT_WINDOW = 4096
+_event_seq = 0
+_last_event: "OrderedDict[str, int]" = OrderedDict()
+_forgotten_seq = 0
+
+def _cache_get(workflow_id: str) -> Optional[Tuple[str, bytes]]:
+    """Return the cached (status, payload) of a finished workflow"""
+    if not _cache_live:
+        return None
+
+    entry = _terminal_cache.get(workflow_id)
+    if entry is not None:
+        _terminal_cache.move_to_end(workflow_id)
+    return entry
+
+def _invalidate(workflow_id: str) -> None:
+    """Evict a workflow from the cache and record that it has changed"""
+    global _event_seq, _forgotten_seq
+    _event_seq += 1
+
+    _terminal_cache.pop(workflow_id, None)
+    _last_event[workflow_id] = _event_seq
+    _last_event.move_to_end(workflow_id)
+    if len(_last_event) > _EVENT_WINDOW:
+        _, _forgotten_seq = _last_event.popitem(last=False)
+
+def _reset_cache(live: bool) -> None:
+    """Drop every cached payload, and everything fetched so far from being cached"""
+    global _cache_live, _event_seq, _forgotten_seq
+    _event_seq += 1
+
+    _terminal_cache.clear()
+    _last_event.clear()
+    _forgotten_seq = _event_seq
+    _cache_live = live
+
+def _serialize(workflow: WorkflowStatus, seen_seq: int) -> bytes:
+    """
+    Serialize a workflow, caching the payload if it has finished
+
+    `seen_seq` is the value of ``_event_seq`` from before the workflow was fetched.
+    """
+    payload = _WF_TA.dump_json(workflow)
+
+    if (
+        _cache_live
+        and workflow.status in TERMINAL_STATUSES
+        and _last_event.get(workflow.workflow_id, _forgotten_seq) <= seen_seq
+    ):
+        _terminal_cache[workflow.workflow_id] = (workflow.status, payload)
+        _terminal_cache.move_to_end(workflow.workflow_id)
+        if len(_terminal_cache) > STATUS_CACHE_SIZE:
+            _terminal_cache.popitem(last=False)
+
+    return payload
+
+async def enqueue_workflow(
+    workflow_id: str,
+    run: str,
+    workflow_request: WorkflowRequest,
+    dag: Optional["CompiledDAG"] = None,
+) -> None:
+    """Queue a workflow run (and its compiled graph, if any) for the next free worker"""
+    payload = json.dumps({
+        "workflow_id": workflow_id,
+        "run": run,
+        "request": workflow_request.model_dump(),
+        "dag": dag._asdict() if dag is not None else None,
+    })
+    await app.state.redis.lpush(TASK_QUEUE, payload)
 
 # ==========================================
 # API Endpoints
@@ -101,15 +547,12 @@ async def health_check():
     """Detailed health check"""
     return {
         "status": "healthy",
-        "active_workflows": len(workflows_store),
-        "timestamp": datetime.utcnow().isoformat(),
+        "active_workflows": await app.state.redis.zcard(WORKFLOW_INDEX),
+        "timestamp": _iso(time.time()),
     }
 
 @app.post("/run-graph", response_model=WorkflowStatus)
-async def run_graph(
-    workflow_request: WorkflowRequest,
-    background_tasks: BackgroundTasks,
-):
+async def run_graph(workflow_request: WorkflowRequest):
     """
     Execute a multi-agent workflow
 
@@ -118,6 +561,15 @@ async def run_graph(
     - parallel: All tasks run concurrently
     - graph: Tasks run based on dependency graph
     """
+    # Compile the dependency graph once, rejecting broken graphs before
+    # anything is stored
+    dag = None
+    if workflow_request.workflow_type == "graph":
+        try:
+            dag = _compile_dag(workflow_request.tasks)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     # Generate workflow ID if not provided
     workflow_id = workflow_request.workflow_id or str(uuid.uuid4())
 
@@ -126,7 +578,7 @@ async def run_graph(
         workflow_id=workflow_id,
         workflow_type=workflow_request.workflow_type,
         status="pending",
-        created_at=datetime.utcnow(),
+        created_at=time.time(),
         tasks=[
             TaskStatus(
                 task_id=f"{workflow_id}-task-{i}",
@@ -139,72 +591,366 @@ async def run_graph(
         metadata=workflow_request.metadata,
     )
 
-    # Store workflow
-    workflows_store[workflow_id] = workflow_status
+    # Store workflow; the run token ties queued work to this submission
+    run = uuid.uuid4().hex
+    await create_workflow(workflow_status, run)
 
-    # Execute workflow in background
-    background_tasks.add_task(
-        execute_workflow,
-        workflow_id,
-        workflow_request,
-    )
+    # Hand off to the queue workers
+    await enqueue_workflow(workflow_id, run, workflow_request, dag)
 
-    return workflow_status
+    return Response(content=_WF_TA.dump_json(workflow_status), media_type="application/json")
 
 @app.get("/status/{workflow_id}", response_model=WorkflowStatus)
 async def get_status(workflow_id: str):
     """Get the status of a workflow"""
-    if workflow_id not in workflows_store:
+    cached = _cache_get(workflow_id)
+    if cached is not None:
+        return Response(content=cached[1], media_type="application/json")
+
+    seen_seq = _event_seq
+    workflow = await load_workflow(workflow_id)
+    if workflow is None:
+        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
+
+    return Response(content=_serialize(workflow, seen_seq), media_type="application/json")
+
+@app.get("/status/{workflow_id}/stream")
+async def stream_status(workflow_id: str):
+    """Stream workflow status as Server-Sent Events until the workflow finishes"""
+    pubsub = app.state.redis.pubsub()
+
+    # Subscribe before the first read so no transition in between is missed
+    await pubsub.subscribe(EVENTS_CHANNEL)
+
+    workflow = await load_workflow(workflow_id)
+    if workflow is None:
+        await pubsub.aclose()
         raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
 
-    return workflows_store[workflow_id]
+    prefix = f"{workflow_id}:"
+
+    async def events():
+        current = workflow
+        try:
+            while current is not None:
+                yield b"data: " + _WF_TA.dump_json(current) + b"\n\n"
+
+                if current.status in TERMINAL_STATUSES:
+                    break
+
+                # Block until this workflow has changed, then re-read it
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                    if message is not None and message["data"].startswith(prefix):
+                        break
+
+                current = await load_workflow(workflow_id)
+        finally:
+            await pubsub.aclose()
+
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 @app.get("/workflows", response_model=List[WorkflowStatus])
 async def list_workflows(
     status: Optional[str] = None,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
 ):
     """List all workflows, optionally filtered by status"""
-    workflows = list(workflows_store.values())
-
-    if status:
-        workflows = [w for w in workflows if w.status == status]
-
-    # Sort by creation time (newest first)
-    workflows.sort(key=lambda w: w.created_at, reverse=True)
+    redis = app.state.redis
+
+    # The indexes are already sorted by creation time (newest first), so only
+    # the first `limit` entries are needed
+    index = _status_index(status) if status else WORKFLOW_INDEX
+    workflow_ids = await redis.zrevrange(index, 0, limit - 1)
+
+    # Finished workflows come from the local cache; only the rest hit Redis
+    entries = {}
+    misses = []
+    for workflow_id in workflow_ids:
+        cached = _cache_get(workflow_id)
+        if cached is not None:
+            entries[workflow_id] = cached
+        else:
+            misses.append(workflow_id)
+
+    if misses:
+        seen_seq = _event_seq
+        async with redis.pipeline(transaction=False) as pipe:
+            for workflow_id in misses:
+                pipe.hgetall(_workflow_key(workflow_id))
+            rows = await pipe.execute()
+
+        for workflow in map(_workflow_from_hash, rows):
+            if workflow is not None:
+                entries[workflow.workflow_id] = (workflow.status, _serialize(workflow, seen_seq))
+
+    # A workflow may have changed status since the index was read
+    payloads = [
+        entries[workflow_id][1]
+        for workflow_id in workflow_ids
+        if workflow_id in entries and (not status or entries[workflow_id][0] == status)
+    ]
 
-    return workflows[:limit]
+    return Response(content=b"[" + b",".join(payloads) + b"]", media_type="application/json")
 
 @app.delete("/workflows/{workflow_id}")
 async def delete_workflow(workflow_id: str):
     """Delete a workflow from the store"""
-    if workflow_id not in workflows_store:
+    async with app.state.redis.pipeline(transaction=True) as pipe:
+        pipe.delete(_workflow_key(workflow_id))
+        pipe.zrem(WORKFLOW_INDEX, workflow_id)
+        for status in WORKFLOW_STATUSES:
+            pipe.zrem(_status_index(status), workflow_id)
+        pipe.publish(EVENTS_CHANNEL, f"{workflow_id}:workflow:deleted")
+        deleted, *_ = await pipe.execute()
+
+    _invalidate(workflow_id)
+    cancel_workflow(workflow_id)
+
+    if not deleted:
         raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
 
-    del workflows_store[workflow_id]
-
     return {"message": f"Workflow {workflow_id} deleted"}
 
+# ==========================================
+# Queue Worker
+# ==========================================
+
+# Workflow executions running on this process by (workflow_id, run), so
+# deletes can cancel them; a resubmitted ID may briefly have two runs here
+_running_workflows: Dict[Tuple[str, str], asyncio.Task] = {}
+
+# execute_workflow arguments decoded from a queued job
+_Job = Tuple[str, str, WorkflowRequest, Optional["CompiledDAG"]]
+
+async def consume_queue(concurrency: int) -> None:
+    """
+    Pull queued workflows and execute them, at most `concurrency` at a time
+
+    A job is only claimed once a slot is free, so anything this worker cannot
+    start yet stays on the queue for other workers. Claimed jobs stay on this
+    worker's processing list until their final state is stored: a run that
+    fails outright (say Redis drops mid-run) is requeued after
+    JOB_RETRY_DELAY, on shutdown the unfinished ones are cancelled and put
+    back on the queue, and if the worker dies another one requeues them once
+    its heartbeat expires.
+    """
+    redis = app.state.redis
+    slots = asyncio.Semaphore(concurrency)
+    processing = _processing_list(WORKER_ID)
+    stopping = False
+
+    async def drop(payload: str) -> None:
+        try:
+            await redis.lrem(processing, 1, payload)
+        except RedisError as e:
+            # Left claimed; running it again later finds nothing to do
+            logger.warning("Could not release a claimed workflow: %s", e)
+
+    async def run_job(payload: str, job: _Job) -> None:
+        # A job only leaves the processing list once its workflow's terminal
+        # state is stored, or the run was deleted or replaced
+        try:
+            await execute_workflow(*job)
+        except asyncio.CancelledError:
+            # Jobs interrupted by shutdown stay claimed and are requeued below
+            if not stopping:
+                await drop(payload)
+            raise
+        except Exception:
+            # Most likely Redis failed mid-run; run the job again once it is back
+            logger.exception("Workflow %s did not finish, requeueing it", job[0])
+            await asyncio.sleep(JOB_RETRY_DELAY)
+            await _requeue_job(processing, payload)
+            return
+
+        await drop(payload)
+
+    def release(key: Tuple[str, str], task: asyncio.Task) -> None:
+        if _running_workflows.get(key) is task:
+            del _running_workflows[key]
+        slots.release()
+
+    # Announce this worker before claiming anything, so its jobs are never
+    # mistaken for orphans
+    while True:
+        try:
+            await redis.set(_heartbeat_key(WORKER_ID), "1", ex=WORKER_HEARTBEAT_TTL)
+            await requeue_orphaned_jobs()
+            break
+        except RedisError as e:
+            logger.warning("Queue worker could not register, retrying: %s", e)
+            await asyncio.sleep(1)
+    heartbeat = asyncio.create_task(keep_alive())
+
+    try:
+        while True:
+            await slots.acquire()
+            try:
+                # LPUSH + BLMOVE from the right keeps the queue FIFO
+                payload = await redis.blmove(TASK_QUEUE, processing, 0, "RIGHT", "LEFT")
+            except RedisError as e:
+                # Connection blip or failover: the job (if any) stays queued
+                slots.release()
+                logger.warning("Could not claim a queued workflow, retrying: %s", e)
+                await asyncio.sleep(1)
+                continue
+            except BaseException:
+                slots.release()
+                raise
+
+            job = _decode_job(payload)
+            if job is None:
+                slots.release()
+                logger.error("Dropping undecodable queued job: %.200s", payload)
+                await drop(payload)
+                continue
+
+            key = (job[0], job[1])
+            task = asyncio.create_task(run_job(payload, job))
+            _running_workflows[key] = task
+            task.add_done_callback(functools.partial(release, key))
+    finally:
+        stopping = True
+        heartbeat.cancel()
+        running = list(_running_workflows.values())
+        for task in running:
+            task.cancel()
+        await asyncio.gather(heartbeat, *running, return_exceptions=True)
+
+        # Hand the interrupted jobs back to the front of the queue
+        await _requeue(processing)
+        await redis.delete(_heartbeat_key(WORKER_ID))
+
+def _decode_job(payload: str) -> Optional[_Job]:
+    """Parse a queued job into execute_workflow arguments, or None if it is malformed"""
+    try:
+        job = json.loads(payload)
+        return (
+            job["workflow_id"],
+            job["run"],
+            WorkflowRequest.model_validate(job["request"]),
+            CompiledDAG(**job["dag"]) if job.get("dag") else None,
+        )
+    except (ValueError, KeyError, TypeError):
+        # ValueError covers JSON and pydantic validation errors
+        return None
+
+async def keep_alive() -> None:
+    """Refresh this worker's heartbeat and recover the jobs of dead workers"""
+    while True:
+        await asyncio.sleep(WORKER_HEARTBEAT_TTL / 3)
+        try:
+            await app.state.redis.set(_heartbeat_key(WORKER_ID), "1", ex=WORKER_HEARTBEAT_TTL)
+            await requeue_orphaned_jobs()
+        except RedisError as e:
+            logger.warning("Worker heartbeat failed: %s", e)
+
+async def requeue_orphaned_jobs() -> None:
+    """Put jobs claimed by workers whose heartbeat has expired back on the queue"""
+    redis = app.state.redis
+    prefix = _processing_list("")
+
+    async for key in redis.scan_iter(match=prefix + "*"):
+        if not await redis.exists(_heartbeat_key(key[len(prefix):])):
+            await _requeue(key)
+
+async def _requeue_job(processing: str, payload: str) -> None:
+    """Move one claimed job back to the front of the queue, leaving it claimed if Redis is unavailable"""
+    try:
+        async with app.state.redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(processing, 1, payload)
+            pipe.rpush(TASK_QUEUE, payload)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning("Could not requeue a workflow, leaving it claimed: %s", e)
+
+async def _requeue(processing: str) -> None:
+    """Move every job on a processing list to the front of the queue, oldest first"""
+    # Newest claims sit on the left; moving those first leaves the oldest
+    # claim at the very front of the queue
+    while await app.state.redis.lmove(processing, TASK_QUEUE, "LEFT", "RIGHT"):
+        pass
+
+async def watch_events() -> None:
+    """
+    React to workflow events published by any process
+
+    Cached payloads of changed workflows are evicted, and deleted workflows
+    that are executing on this process are cancelled. A dropped subscription
+    is re-established, with the cache bypassed until then.
+    """
+    while True:
+        pubsub = app.state.redis.pubsub()
+        try:
+            await pubsub.subscribe(EVENTS_CHANNEL)
+            # Events published while unsubscribed were missed; start afresh
+            _reset_cache(live=True)
+
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                if message is None:
+                    continue
+
+                workflow_id, _, status = message["data"].rsplit(":", 2)
+                _invalidate(workflow_id)
+
+                if status == "deleted":
+                    cancel_workflow(workflow_id)
+        except Exception:
+            logger.exception("Workflow event subscription failed, reconnecting")
+        finally:
+            _reset_cache(live=False)
+            await pubsub.aclose()
+
+        await asyncio.sleep(1)
+
+def cancel_workflow(workflow_id: str) -> None:
+    """Cancel every run of a workflow executing on this process, along with all of their tasks"""
+    # At most `concurrency` entries, so a scan is cheaper than a second index
+    for (running_id, _), task in _running_workflows.items():
+        if running_id == workflow_id:
+            task.cancel()
+
 # ==========================================
 # Workflow Execution Logic
 # ==========================================
 
-async def execute_workflow(workflow_id: str, workflow_request: WorkflowRequest):
+async def execute_workflow(
+    workflow_id: str,
+    run: str,
+    workflow_request: WorkflowRequest,
+    dag: Optional["CompiledDAG"] = None,
+):
     """
     Execute a workflow based on its type
-    This runs in the background
+    This runs on a queue worker
     """
-    workflow = workflows_store[workflow_id]
+    workflow = await load_runtime(workflow_id, run)
+    if workflow is None or workflow.status in TERMINAL_STATUSES:
+        # Deleted or resubmitted before it got a chance to run, or a requeued
+        # job that had already finished
+        return
+
+    # A job requeued after its worker stopped mid-run starts over
+    restarted = [i for i, task in enumerate(workflow.tasks) if task.status != "pending"]
+    for i in restarted:
+        task = workflow.tasks[i]
+        workflow.tasks[i] = _TaskRT(task.task_id, task.agent_id, task.agent_role)
+
     workflow.status = "running"
-    workflow.started_at = datetime.utcnow()
+    workflow.started_at = time.time()
+    await save_workflow(workflow, restarted)
+
+    failed_tasks: List[int] = []
 
     try:
         if workflow_request.workflow_type == "sequential":
-            await execute_sequential(workflow_id, workflow_request)
+            await execute_sequential(workflow, workflow_request)
         elif workflow_request.workflow_type == "parallel":
-            await execute_parallel(workflow_id, workflow_request)
+            await execute_parallel(workflow, workflow_request)
         elif workflow_request.workflow_type == "graph":
-            await execute_graph(workflow_id, workflow_request)
+            await execute_graph(workflow, workflow_request, dag or _compile_dag(workflow_request.tasks))
 
         # Check if all tasks completed successfully
         all_completed = all(t.status == "completed" for t in workflow.tasks)
@@ -216,26 +962,29 @@ async def execute_workflow(workflow_id: str, workflow_request: WorkflowRequest):
             workflow.status = "partial" if any(t.status == "completed" for t in workflow.tasks) else "failed"
 
     except Exception as e:
+        # Task groups wrap the failures of their tasks in an ExceptionGroup
+        error = "; ".join(map(str, e.exceptions)) if isinstance(e, ExceptionGroup) else str(e)
+
         workflow.status = "failed"
         # Mark all pending/running tasks as failed
-        for task in workflow.tasks:
+        for i, task in enumerate(workflow.tasks):
             if task.status in ["pending", "running"]:
                 task.status = "failed"
-                task.error = str(e)
+                task.error = error
+                failed_tasks.append(i)
 
-    workflow.completed_at = datetime.utcnow()
+    workflow.completed_at = time.time()
+    await save_workflow(workflow, failed_tasks)
 
-async def execute_sequential(workflow_id: str, workflow_request: WorkflowRequest):
+async def execute_sequential(workflow: _WorkflowRT, workflow_request: WorkflowRequest):
     """Execute tasks one after another"""
-    workflow = workflows_store[workflow_id]
-
     previous_result = None
 
     for i, task_def in enumerate(workflow_request.tasks):
         task_status = workflow.tasks[i]
 
         # Execute the task
-        result = await execute_task(task_status, task_def, previous_result)
+        result = await execute_task(workflow, i, task_def, previous_result)
 
         # Store result for next task
         previous_result = result
@@ -244,75 +993,117 @@ async def execute_sequential(workflow_id: str, workflow_request: WorkflowRequest
         if task_status.status == "failed" and task_def.agent_role != "qa":
             break
 
-async def execute_parallel(workflow_id: str, workflow_request: WorkflowRequest):
+async def execute_parallel(workflow: _WorkflowRT, workflow_request: WorkflowRequest):
     """Execute all tasks concurrently"""
-    import asyncio
+    # Execute all tasks concurrently; cancelling the workflow cancels them all
+    async with asyncio.TaskGroup() as tg:
+        for i, task_def in enumerate(workflow_request.tasks):
+            tg.create_task(execute_task(workflow, i, task_def, None))
 
-    workflow = workflows_store[workflow_id]
+class CompiledDAG(NamedTuple):
+    """
+    Dependency graph in struct-of-arrays form
 
-    # Execute all tasks concurrently
-    tasks = [
-        execute_task(workflow.tasks[i], task_def, None)
-        for i, task_def in enumerate(workflow_request.tasks)
-    ]
+    Tasks are referred to by their index in the request, so scheduling walks
+    flat int lists instead of re-resolving agent_id strings.
+    """
+    agent_ids: List[str]
+    deps_idx: List[List[int]]
+    waves: List[List[int]]
 
-    await asyncio.gather(*tasks, return_exceptions=True)
+def _compile_dag(tasks: List[AgentTask]) -> CompiledDAG:
+    """
+    Resolve dependencies to indices and group tasks into waves (Kahn's algorithm)
 
-async def execute_graph(workflow_id: str, workflow_request: WorkflowRequest):
-    """Execute tasks based on dependency graph"""
-    import asyncio
+    Every task in a wave depends only on tasks in earlier waves, so each wave
+    can run fully in parallel.
 
-    workflow = workflows_store[workflow_id]
-    completed_tasks: Dict[str, Any] = {}
-    task_events: Dict[str, asyncio.Event] = {}
+    Args:
+        tasks: Task definitions; dependencies refer to other tasks' agent_id
 
-    # Build task map and create events for each task
-    task_map = {
-        task_def.agent_id: (i, task_def)
-        for i, task_def in enumerate(workflow_request.tasks)
-    }
+    Returns:
+        The compiled graph
 
-    # Create an event for each task to signal completion
-    for task_def in workflow_request.tasks:
-        task_events[task_def.agent_id] = asyncio.Event()
-
-    async def execute_with_deps(task_def: AgentTask, task_idx: int):
-        """Execute a task after its dependencies are met"""
-        # Wait for dependencies using events (no polling)
-        if task_def.depends_on:
-            # Wait for all dependency events to be set
-            await asyncio.gather(*[
-                task_events[dep_id].wait()
-                for dep_id in task_def.depends_on
-            ])
-
-        # Gather dependency results
-        dep_results = {
-            dep_id: completed_tasks[dep_id]
-            for dep_id in task_def.depends_on
-        } if task_def.depends_on else None
-
-        # Execute task
-        result = await execute_task(workflow.tasks[task_idx], task_def, dep_results)
-
-        # Mark as completed
-        completed_tasks[task_def.agent_id] = result
-
-        # Signal completion to dependent tasks
-        task_events[task_def.agent_id].set()
-
-        return result
-
-    # Execute all tasks (they'll wait for their dependencies internally)
-    tasks = [
-        execute_with_deps(task_def, i)
-        for i, task_def in enumerate(workflow_request.tasks)
-    ]
+    Raises:
+        ValueError: If an agent_id is duplicated, a dependency is unknown,
+            or the dependencies contain a cycle
+    """
+    agent_ids = [task_def.agent_id for task_def in tasks]
+
+    idx_of: Dict[str, int] = {}
+    for i, agent_id in enumerate(agent_ids):
+        if agent_id in idx_of:
+            raise ValueError(f"Duplicate task agent_id: {agent_id}")
+        idx_of[agent_id] = i
+
+    deps_idx: List[List[int]] = []
+    for task_def in tasks:
+        for dep_id in task_def.depends_on:
+            if dep_id not in idx_of:
+                raise ValueError(f"Task {task_def.agent_id} depends on unknown task {dep_id}")
+        deps_idx.append([idx_of[dep_id] for dep_id in task_def.depends_on])
+
+    in_degree = [len(deps) for deps in deps_idx]
+    children: List[List[int]] = [[] for _ in tasks]
+    for i, deps in enumerate(deps_idx):
+        for dep in deps:
+            children[dep].append(i)
+
+    waves: List[List[int]] = []
+    wave = [i for i, degree in enumerate(in_degree) if degree == 0]
+    scheduled = 0
+
+    while wave:
+        waves.append(wave)
+        scheduled += len(wave)
+
+        next_wave = []
+        for i in wave:
+            for child in children[i]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    next_wave.append(child)
+        wave = next_wave
+
+    if scheduled != len(tasks):
+        raise ValueError("Task dependencies contain a cycle")
+
+    return CompiledDAG(
+        agent_ids=agent_ids,
+        deps_idx=deps_idx,
+        waves=waves,
+    )
 
-    await asyncio.gather(*tasks, return_exceptions=True)
+async def execute_graph(
+    workflow: _WorkflowRT,
+    workflow_request: WorkflowRequest,
+    dag: CompiledDAG,
+):
+    """Execute tasks based on dependency graph, one topological wave at a time"""
+    tasks = workflow_request.tasks
+    agent_ids = dag.agent_ids
+    deps_idx = dag.deps_idx
+    results: List[Any] = [None] * len(tasks)
+
+    for wave in dag.waves:
+        # Everything this wave depends on has finished in an earlier wave
+        async with asyncio.TaskGroup() as tg:
+            running = [
+                tg.create_task(execute_task(
+                    workflow,
+                    i,
+                    tasks[i],
+                    {agent_ids[dep]: results[dep] for dep in deps_idx[i]} if deps_idx[i] else None,
+                ))
+                for i in wave
+            ]
+
+        for i, task in zip(wave, running):
+            results[i] = task.result()
 
 async def execute_task(
-    task_status: TaskStatus,
+    workflow: _WorkflowRT,
+    task_idx: int,
     task_def: AgentTask,
     context: Any,
 ) -> Optional[Dict[str, Any]]:
@@ -324,43 +1115,62 @@ async def execute_task(
     2. Swarms agents directly
     3. External services
     """
-    import asyncio
-    import httpx
-
-    task_status.status = "running"
-    task_status.started_at = datetime.utcnow()
-
-    try:
-        # TODO: Call TypeScript agent via bridge
-        # For now, simulate execution
-
-        # Simulate some work
-        await asyncio.sleep(1)
-
-        # Mock successful result
-        result = {
-            "agent_id": task_def.agent_id,
-            "agent_role": task_def.agent_role,
-            "input": task_def.input_data,
-            "context": context,
-            "output": {
-                "success": True,
-                "message": f"{task_def.agent_role} agent completed successfully",
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-        }
-
-        task_status.status = "completed"
-        task_status.result = result
-        task_status.completed_at = datetime.utcnow()
-
-        return result
-
-    except Exception as e:
-        task_status.status = "failed"
-        task_status.error = str(e)
-        task_status.completed_at = datetime.utcnow()
-        return None
+    # Only AGENT_MAX_CONCURRENCY tasks run at once; the rest wait here as pending
+    async with AGENT_SEM:
+        task_status = workflow.tasks[task_idx]
+        task_status.status = "running"
+        task_status.started_at = time.time()
+        await save_task(workflow, task_idx)
+
+        try:
+            if app.state.http is not None:
+                # Call TypeScript agent via bridge
+                response = await app.state.http.post("/run", json={
+                    "agent_id": task_def.agent_id,
+                    "agent_role": task_def.agent_role,
+                    "input": task_def.input_data,
+                    "context": context,
+                })
+                response.raise_for_status()
+                result = response.json()
+                # Task results are JSON objects; keep any other reply under "output"
+                if not isinstance(result, dict):
+                    result = {"output": result}
+                completed_at = time.time()
+            else:
+                # No bridge configured, simulate execution
+
+                # Simulate some work
+                if _MOCK_DELAY:
+                    await asyncio.sleep(_MOCK_DELAY)
+
+                # Mock successful result
+                completed_at = time.time()
+                result = {
+                    "agent_id": task_def.agent_id,
+                    "agent_role": task_def.agent_role,
+                    "input": task_def.input_data,
+                    "context": context,
+                    "output": {
+                        "success": True,
+                        "message": f"{task_def.agent_role} agent completed successfully",
+                        "timestamp": _iso(completed_at),
+                    }
+                }
+
+            task_status.status = "completed"
+            task_status.result = result
+            task_status.completed_at = completed_at
+            await save_task(workflow, task_idx)
+
+            return result
+
+        except Exception as e:
+            task_status.status = "failed"
+            task_status.error = str(e)
+            task_status.completed_at = time.time()
+            await save_task(workflow, task_idx)
+            return None
 
 # ==========================================
 # Run Server
@@ -372,10 +1182,20 @@ if __name__ == "__main__":
     host = os.getenv("ORCHESTRATOR_HOST", "0.0.0.0")
     port = int(os.getenv("ORCHESTRATOR_PORT", "8000"))
 
+    # Prefer the libuv event loop and httptools parser (C implementations);
+    # uvloop is not available on Windows, so fall back to the stock loop there
+    try:
+        import uvloop  # noqa: F401
+        loop_impl, http_impl = "uvloop", "httptools"
+    except ImportError:
+        loop_impl, http_impl = "asyncio", "auto"
+
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
+        loop=loop_impl,
+        http=http_impl,
         reload=True,
         log_level=os.getenv("LOG_LEVEL", "info").lower(),
     )
@@ -6,15 +6,47 @@ Provides workflow orchestration using Swarms agents and patterns
 from swarms import Agent
 from swarms.structs import SequentialWorkflow, ConcurrentWorkflow
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
 import os
+import threading
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Agents are cached per (role, agent_id, model, temperature)
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", "256"))
+
+# Agent.run is synchronous (network, decoding, disk); run it on a bounded
+# pool so it never blocks the event loop
+AGENT_WORKERS = int(os.getenv("AGENT_WORKERS", "16"))
+_agent_executor = ThreadPoolExecutor(max_workers=AGENT_WORKERS, thread_name_prefix="swarms-agent")
+
 # ==========================================
 # Agent Factory
 # ==========================================
 
+class PooledAgent(Agent):
+    """
+    Swarms agent that is reused across tasks
+
+    Every run starts from the conversation the agent was created with, so
+    nothing from earlier tasks or workflows leaks into the prompt, and runs
+    on the same instance are serialized since its memory is not thread-safe.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._run_lock = threading.Lock()
+        self._initial_history = list(self.short_memory.conversation_history)
+
+    def run(self, task: Optional[str] = None, *args, **kwargs):
+        with self._run_lock:
+            self.short_memory.conversation_history = list(self._initial_history)
+            return super().run(task, *args, **kwargs)
+
+
 class AgentFactory:
     """Creates Swarms agents based on role definitions"""
 
@@ -24,6 +56,7 @@ class AgentFactory:
         agent_id: str,
         llm_model: str = "gpt-4o",
         temperature: float = 0.7,
+        pooled: bool = False,
     ) -> Agent:
         """
         Create a Swarms agent for a specific role
@@ -33,6 +66,7 @@ class AgentFactory:
             agent_id: Unique identifier for the agent
             llm_model: LLM model to use
             temperature: Temperature for generation
+            pooled: Create a PooledAgent, safe to reuse across tasks
 
         Returns:
             Configured Swarms Agent
@@ -102,7 +136,8 @@ Provide clear task assignments and maintain workflow efficiency.""",
         system_prompt = system_prompts.get(role, "You are a helpful AI assistant.")
 
         # Create Swarms agent
-        agent = Agent(
+        agent_class = PooledAgent if pooled else Agent
+        agent = agent_class(
             agent_name=f"{role.capitalize()}Agent-{agent_id}",
             system_prompt=system_prompt,
             model_name=llm_model,
@@ -118,6 +153,37 @@ Provide clear task assignments and maintain workflow efficiency.""",
 
         return agent
 
+    @staticmethod
+    def get_agent(
+        role: str,
+        agent_id: str,
+        llm_model: str = "gpt-4o",
+        temperature: float = 0.7,
+    ) -> Agent:
+        """
+        Get a pooled Swarms agent, creating it on first use
+
+        Agents are reused across tasks and workflows, so callers should pass
+        all per-call data through the input of ``agent.run``. Each run starts
+        from a fresh conversation, and concurrent runs on the same agent wait
+        for each other.
+
+        Args:
+            role: Agent role (frontend, backend, qa, debugger, coordinator)
+            agent_id: Unique identifier for the agent
+            llm_model: LLM model to use
+            temperature: Temperature for generation
+
+        Returns:
+            Cached PooledAgent
+        """
+        return _get_agent(role, agent_id, llm_model, temperature)
+
+
+@functools.lru_cache(maxsize=AGENT_POOL_SIZE)
+def _get_agent(role: str, agent_id: str, llm_model: str, temperature: float) -> Agent:
+    return AgentFactory.create_agent(role, agent_id, llm_model, temperature, pooled=True)
+
 
 # ==========================================
 # Workflow Builders
@@ -189,21 +255,26 @@ class WorkflowBuilder:
         Returns:
             List of task results
         """
-        import asyncio
+        loop = asyncio.get_running_loop()
 
         # Build dependency graph
         task_map = {task["agent_id"]: task for task in tasks}
         results = {}
 
+        # Create an event for each task to signal completion
+        task_events = {task["agent_id"]: asyncio.Event() for task in tasks}
+
         async def execute_with_deps(task: Dict[str, Any]) -> str:
             """Execute task after dependencies are met"""
-            # Wait for dependencies
+            # Wait for dependencies using events (no polling)
             if task.get("depends_on"):
-                while not all(dep_id in results for dep_id in task["depends_on"]):
-                    await asyncio.sleep(0.1)
+                await asyncio.gather(*(
+                    task_events[dep_id].wait()
+                    for dep_id in task["depends_on"]
+                ))
 
             # Create agent
-            agent = AgentFactory.create_agent(
+            agent = AgentFactory.get_agent(
                 role=task["agent_role"],
                 agent_id=task["agent_id"],
             )
@@ -221,12 +292,15 @@ class WorkflowBuilder:
             if context:
                 input_text = f"{input_text}\n\nContext from previous steps:\n{context}"
 
-            # Execute
-            result = agent.run(input_text)
+            # Execute off the event loop so dependents keep being scheduled
+            result = await loop.run_in_executor(_agent_executor, agent.run, input_text)
 
             # Store result
             results[task["agent_id"]] = result
 
+            # Signal completion to dependent tasks
+            task_events[task["agent_id"]].set()
+
             return result
 
         # Execute all tasks (they handle their own dependencies)
@@ -258,11 +332,11 @@ class WorkflowPatterns:
             Configured sequential workflow
         """
         # Create agents
-        frontend_agent = AgentFactory.create_agent("frontend", "fs-frontend")
-        backend_agent = AgentFactory.create_agent("backend", "fs-backend")
-        qa_agent_1 = AgentFactory.create_agent("qa", "fs-qa-1")
-        debugger_agent = AgentFactory.create_agent("debugger", "fs-debugger")
-        qa_agent_2 = AgentFactory.create_agent("qa", "fs-qa-2")
+        frontend_agent = AgentFactory.get_agent("frontend", "fs-frontend")
+        backend_agent = AgentFactory.get_agent("backend", "fs-backend")
+        qa_agent_1 = AgentFactory.get_agent("qa", "fs-qa-1")
+        debugger_agent = AgentFactory.get_agent("debugger", "fs-debugger")
+        qa_agent_2 = AgentFactory.get_agent("qa", "fs-qa-2")
 
         # Build workflow
         workflow = WorkflowBuilder.build_sequential_workflow(
@@ -295,9 +369,9 @@ class WorkflowPatterns:
             Configured concurrent workflow
         """
         # Create specialized QA agents
-        security_qa = AgentFactory.create_agent("qa", "qa-security")
-        performance_qa = AgentFactory.create_agent("qa", "qa-performance")
-        style_qa = AgentFactory.create_agent("qa", "qa-style")
+        security_qa = AgentFactory.get_agent("qa", "qa-security")
+        performance_qa = AgentFactory.get_agent("qa", "qa-performance")
+        style_qa = AgentFactory.get_agent("qa", "qa-style")
 
         # Build workflow
         workflow = WorkflowBuilder.build_concurrent_workflow(
@@ -320,7 +394,7 @@ class WorkflowPatterns:
         Returns:
             Coordinator agent (manages sub-agents internally)
         """
-        coordinator = AgentFactory.create_agent(
+        coordinator = AgentFactory.get_agent(
             "coordinator",
             "coordinator-main",
             temperature=0.6,
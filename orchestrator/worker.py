@@ -0,0 +1,34 @@
+"""
+AI Orchestra - Queue Worker
+Executes workflows queued in Redis by the orchestration service
+
+Run one or more of these alongside the API to scale workflow execution
+across processes or hosts. Set ORCHESTRATOR_EMBEDDED_WORKER=false on the API
+to make it submit-only.
+"""
+
+import asyncio
+
+from main import WORKER_CONCURRENCY, close_clients, configure_loop, consume_queue, open_clients, watch_events
+
+async def run_worker() -> None:
+    """Consume the workflow queue until cancelled"""
+    configure_loop()
+    await open_clients()
+
+    try:
+        # Events let deletes on the API cancel workflows running here
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(consume_queue(WORKER_CONCURRENCY))
+            tg.create_task(watch_events())
+    finally:
+        await close_clients()
+
+if __name__ == "__main__":
+    # Use the libuv event loop where available (not on Windows)
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
+
+    run(run_worker())
@@ -8,7 +8,7 @@ REM Check if Python is installed
 python --version >nul 2>&1
 if errorlevel 1 (
     echo ❌ Python is not installed!
-    echo Please install Python 3.10 or higher
+    echo Please install Python 3.11 or higher
     pause
     exit /b 1
 )
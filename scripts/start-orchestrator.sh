@@ -7,17 +7,17 @@ echo ""
 # Check if Python is installed
 if ! command -v python3 &> /dev/null; then
     echo "❌ Python 3 is not installed!"
-    echo "Please install Python 3.10 or higher"
+    echo "Please install Python 3.11 or higher"
     exit 1
 fi
 
 # Check Python version
 python_version=$(python3 --version | cut -d' ' -f2 | cut -d'.' -f1,2)
-required_version="3.10"
+required_version="3.11"
 
 if (( $(echo "$python_version < $required_version" | bc -l) )); then
     echo "❌ Python version $python_version is too old!"
-    echo "Please install Python 3.10 or higher"
+    echo "Please install Python 3.11 or higher"
     exit 1
 fi
 